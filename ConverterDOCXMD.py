@@ -1,25 +1,29 @@
 import argparse
+from pathlib import Path
 from docx import Document
-from markdownify import markdownify as md
+
+# Markdown prefixes for the paragraph styles that carry document structure
+STYLE_PREFIXES = {
+    'Title': '# ',
+    'Heading 1': '# ',
+    'Heading 2': '## ',
+    'Heading 3': '### ',
+}
 
 def docx_to_markdown(docx_filename, md_filename):
     # Load the .docx file
     doc = Document(docx_filename)
     
-    # Extract the text from the .docx
-    full_text = []
+    # Emit one Markdown block per non-empty paragraph, turning headings into '#' lines
+    lines = []
     for paragraph in doc.paragraphs:
-        full_text.append(paragraph.text)
-    
-    # Join the text with newlines
-    docx_content = '\n'.join(full_text)
-    
-    # Convert the text to markdown
-    markdown_content = md(docx_content)
+        text = paragraph.text
+        if not text:
+            continue
+        lines.append(STYLE_PREFIXES.get(paragraph.style.name, '') + text)
     
     # Write the markdown content to the specified file
-    with open(md_filename, 'w', encoding='utf-8') as md_file:
-        md_file.write(markdown_content)
+    Path(md_filename).write_text('\n\n'.join(lines), encoding='utf-8')
 
     print(f"Converted {docx_filename} to {md_filename} successfully!")
 
@@ -2,16 +2,23 @@
 
 from fastapi import FastAPI, UploadFile, File, Query
 from fastapi.middleware.cors import CORSMiddleware
-from summarizer import process_document  # Ensure this function is correctly updated
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from summarizer import process_document, setup_llm_caching, stream_document  # Ensure this function is correctly updated
 import uvicorn
 from typing import Dict
 import uuid
 import logging
+import orjson
+import os
+import tempfile
+import aiofiles
 
-app = FastAPI(title="Document Summarizer API")
+# Summaries can be large, so responses are encoded with orjson rather than the stdlib json module
+app = FastAPI(title="Document Summarizer API", default_response_class=ORJSONResponse)
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging once for the whole backend; set LOG_LEVEL=DEBUG for per-chapter details
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Configure CORS to allow requests from the frontend
@@ -23,9 +30,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Summaries are text, so compress responses for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # In-memory session storage (replace with persistent storage for production)
 session_storage: Dict[str, Dict] = {}
 
+# Size of the chunks read from the upload stream
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+@app.on_event("startup")
+async def startup():
+    """
+    Enables the LLM response cache when the server starts.
+    """
+    setup_llm_caching()
+
+async def save_upload(file: UploadFile) -> str:
+    """
+    Streams an uploaded file to a temporary file in fixed-size chunks.
+
+    Args:
+        file (UploadFile): The uploaded document.
+
+    Returns:
+        str: Path of the temporary file; the caller is responsible for removing it.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
+        tmp_path = tmp.name
+    try:
+        async with aiofiles.open(tmp_path, "wb") as out_file:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await out_file.write(chunk)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+    logger.debug("File uploaded: %s", file.filename)
+    return tmp_path
+
 @app.post("/summarize")
 async def summarize(file: UploadFile = File(...), session_id: str = Query(None)):
     """
@@ -38,13 +80,13 @@ async def summarize(file: UploadFile = File(...), session_id: str = Query(None))
     Returns:
         dict: Summaries and the session ID.
     """
+    tmp_path = None
     try:
-        # Read the uploaded file content
-        content = await file.read()
-        logger.debug(f"File uploaded: {file.filename}")
+        # Stream the uploaded file to a temporary file
+        tmp_path = await save_upload(file)
 
         # Process the document and get summaries
-        summaries = process_document(content, file.filename)  # Pass 'file.filename'
+        summaries = await process_document(tmp_path, file.filename)  # Pass 'file.filename'
 
         # Assign a new session ID if not provided
         if not session_id:
@@ -56,8 +98,62 @@ async def summarize(file: UploadFile = File(...), session_id: str = Query(None))
         # Return the summaries as JSON along with the session ID
         return {"summaries": summaries, "session_id": session_id}
     except Exception as e:
-        logger.error(f"Error in /summarize endpoint: {str(e)}")
+        logger.error("Error in /summarize endpoint: %s", e)
         return {"error": str(e)}
+    finally:
+        if tmp_path:
+            os.remove(tmp_path)
+
+@app.post("/summarize/stream")
+async def summarize_stream(file: UploadFile = File(...), session_id: str = Query(None)):
+    """
+    Endpoint to upload a Word document and stream chapter summaries as they are generated.
+
+    The response is newline-delimited JSON: one {"index", "title", "summary", "failed"}
+    object per chapter in completion order, where index is the chapter's position in
+    the document and failed tells whether the summary is an error message, or a single
+    {"error"} object if processing fails.
+    The session ID is returned in the X-Session-ID header.
+
+    Args:
+        file (UploadFile): The uploaded document.
+        session_id (str, optional): Unique identifier for the session.
+
+    Returns:
+        StreamingResponse: The chapter summaries as they complete, or the error
+        as JSON if the upload could not be saved.
+    """
+    try:
+        tmp_path = await save_upload(file)
+    except Exception as e:
+        logger.error("Error in /summarize/stream endpoint: %s", e)
+        return {"error": str(e)}
+
+    # Assign a new session ID if not provided
+    if not session_id:
+        session_id = str(uuid.uuid4())
+
+    async def stream_summaries():
+        results = {}
+        try:
+            async for index, chapter_title, summary, failed in stream_document(tmp_path, file.filename):
+                results[index] = (chapter_title, summary)
+                line = {"index": index, "title": chapter_title, "summary": summary, "failed": failed}
+                yield orjson.dumps(line) + b"\n"
+
+            # Store summaries in the session storage, in document order
+            session_storage[session_id] = dict(results[index] for index in sorted(results))
+        except Exception as e:
+            logger.error("Error in /summarize/stream endpoint: %s", e)
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+        finally:
+            os.remove(tmp_path)
+
+    return StreamingResponse(
+        stream_summaries(),
+        media_type="application/x-ndjson",
+        headers={"X-Session-ID": session_id}
+    )
 
 if __name__ == "__main__":
     uvicorn.run("app:app", host="0.0.0.0", port=8001, reload=True)
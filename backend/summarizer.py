@@ -1,19 +1,45 @@
 # backend/summarizer.py
 
+import asyncio
+import hashlib
+import json
 import logging
-from docx import Document
-from io import BytesIO
+import os
+import zipfile
+from functools import lru_cache
+import diskcache
+import httpx
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
 from langchain_ollama import OllamaLLM
-from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain.globals import set_llm_cache
+from langchain_community.cache import SQLiteCache
 
-# Set up logging configuration
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging is configured by the application entry point (see app.py)
 logger = logging.getLogger(__name__)
 
-# Initialize the Ollama LLM with Llama 3
-llm = OllamaLLM(model="llama3.1", temperature=0.3)
-logger.info("Initialized the Ollama LLM with Llama 3.1 model.")
+# Ollama model and server used for summarization (the default base URL is the local server)
+# Summaries hold up well on smaller quantizations, which decode faster: point LLM_MODEL at
+# a tag such as llama3.1:8b-instruct-q3_K_M after checking quality on a sample of documents.
+# Start the Ollama server with OLLAMA_NUM_PARALLEL set to at least LLM_CONCURRENCY
+# (e.g. OLLAMA_NUM_PARALLEL=8) so batched chapter requests are served in parallel.
+LLM_MODEL = os.getenv("LLM_MODEL", "llama3.1")
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL")
+
+# Context window requested from Ollama; must hold a full chunk plus the prompt
+LLM_NUM_CTX = 8192
+
+# Attempts per LLM call when the connection to the Ollama server fails
+LLM_MAX_ATTEMPTS = 3
+
+# How long Ollama keeps the model loaded after a request (a negative value keeps it
+# loaded indefinitely). While loaded, Ollama reuses the cached prefix of the prompt,
+# so the fixed instructions at the start of the templates below are not re-processed.
+# The templates keep the instructions first and the chapter content last for that reason.
+_keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "-1")
+OLLAMA_KEEP_ALIVE = int(_keep_alive) if _keep_alive.lstrip("-").isdigit() else _keep_alive
 
 # Define a prompt template for summarization
 prompt = PromptTemplate(
@@ -29,126 +55,572 @@ prompt = PromptTemplate(
     """
 )
 
-# Create a chain for summarization
-summarize_chain = LLMChain(llm=llm, prompt=prompt)
-logger.info("Created summarization chain with the given prompt template.")
+# Define a prompt template for combining the partial summaries of a long chapter
+reduce_prompt = PromptTemplate(
+    input_variables=["parts"],
+    template="""
+    You are an assistant that summarizes chapters of a document.
+
+    Combine these partial summaries into one coherent summary:
+
+    {parts}
+
+    Summary:
+    """
+)
+
+# Define a prompt template for summarizing several short chapters in one request
+group_prompt = PromptTemplate(
+    input_variables=["sections"],
+    template="""
+    You are an assistant that summarizes chapters of a document.
+
+    Summarize each of the following chapters. Answer with a JSON object only,
+    mapping each chapter title exactly as written to its summary:
 
-def read_word_document(file_content: bytes) -> Document:
+    {sections}
+
+    JSON:
     """
-    Reads a Word document and returns the Document object.
+)
+
+@lru_cache(maxsize=8)
+def get_llm(model: str = LLM_MODEL, base_url: str = OLLAMA_BASE_URL, output_format: str = "") -> OllamaLLM:
+    """
+    Returns the Ollama LLM for a model and server, creating it on first use.
+
+    Clients are shared per (model, base_url, output_format) so their HTTP connection
+    pool is reused across requests instead of being rebuilt for every document.
 
     Args:
-        file_content (bytes): The binary content of the Word document.
+        model (str): Name of the Ollama model.
+        base_url (str, optional): URL of the Ollama server.
+        output_format (str): "json" to constrain the output to valid JSON, or "" for free text.
 
     Returns:
-        Document: The parsed Word document.
+        OllamaLLM: The shared LLM client.
     """
-    try:
-        logging.debug("Reading Word document content.")
-        doc = Document(BytesIO(file_content))  # Correctly parse the .docx content
-        logging.info("Successfully extracted text from the Word document.")
-        return doc
-    except Exception as e:
-        logging.error(f"Error reading Word document: {str(e)}")
-        raise
+    llm = OllamaLLM(
+        model=model,
+        base_url=base_url,
+        temperature=0.3,
+        num_ctx=LLM_NUM_CTX,
+        keep_alive=OLLAMA_KEEP_ALIVE,
+        format=output_format
+    )
+    logger.info("Initialized the Ollama LLM with %s model.", model)
+    return llm
+
+def _with_retry(runnable):
+    """
+    Retries a runnable when the connection to the Ollama server fails.
+
+    Args:
+        runnable (Runnable): The chain to retry.
+
+    Returns:
+        Runnable: The chain, retried up to LLM_MAX_ATTEMPTS times on connection errors.
+    """
+    return runnable.with_retry(
+        retry_if_exception_type=(ConnectionError, httpx.TransportError),
+        stop_after_attempt=LLM_MAX_ATTEMPTS
+    )
+
+@lru_cache(maxsize=8)
+def get_summarize_chain(model: str = LLM_MODEL, base_url: str = OLLAMA_BASE_URL):
+    """
+    Returns the chain that summarizes a single chunk of chapter content.
+
+    Args:
+        model (str): Name of the Ollama model.
+        base_url (str, optional): URL of the Ollama server.
+
+    Returns:
+        Runnable: The prompt piped into the shared LLM, retried on connection errors.
+    """
+    return _with_retry(prompt | get_llm(model, base_url))
+
+@lru_cache(maxsize=8)
+def get_reduce_chain(model: str = LLM_MODEL, base_url: str = OLLAMA_BASE_URL):
+    """
+    Returns the chain that combines the partial summaries of a chapter.
+
+    Args:
+        model (str): Name of the Ollama model.
+        base_url (str, optional): URL of the Ollama server.
+
+    Returns:
+        Runnable: The prompt piped into the shared LLM, retried on connection errors.
+    """
+    return _with_retry(reduce_prompt | get_llm(model, base_url))
+
+@lru_cache(maxsize=8)
+def get_group_chain(model: str = LLM_MODEL, base_url: str = OLLAMA_BASE_URL):
+    """
+    Returns the chain that summarizes several short chapters in one request.
+
+    The LLM runs in Ollama's JSON mode, so the answer always parses as JSON.
+
+    Args:
+        model (str): Name of the Ollama model.
+        base_url (str, optional): URL of the Ollama server.
+
+    Returns:
+        Runnable: The prompt piped into the JSON-mode LLM, retried on connection errors.
+    """
+    return _with_retry(group_prompt | get_llm(model, base_url, "json"))
+
+# Maximum number of LLM calls dispatched concurrently
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+
+# Paragraph styles that represent chapter titles (adjust based on your documents)
+CHAPTER_STYLES = frozenset(('Title', 'Heading 1', 'Heading 2'))
+
+# XML parser used for the document parts (external entities are never resolved)
+xml_parser = etree.XMLParser(resolve_entities=False, huge_tree=True)
+
+# Content of a paragraph's own runs, as python-docx reads paragraph text. Runs nested
+# deeper (text boxes, both branches of mc:AlternateContent, fields, tracked
+# insertions) are not part of the paragraph's text.
+run_content = etree.XPath("w:r/* | w:hyperlink/w:r/*", namespaces={'w': nsmap['w']})
+
+# Text equivalents of the run content elements; w:t holds its own text
+run_text = {
+    qn('w:t'): None,
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:br'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+
+# Chapters shorter than this (in characters) are returned as they are: a summary
+# would not be shorter than the text itself
+SHORT_CHAPTER_LENGTH = int(os.getenv("SHORT_CHAPTER_LENGTH", "300"))
+
+# Adjacent chapters are packed into a single request while their combined content
+# stays within this many characters
+GROUP_MAX_CHARS = int(os.getenv("GROUP_MAX_CHARS", "3000"))
+
+# Chapters longer than this (in tokens) are summarized chunk by chunk
+CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "3000"))
+CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "100"))
+
+@lru_cache(maxsize=1)
+def get_text_splitter() -> RecursiveCharacterTextSplitter:
+    """
+    Returns the splitter for long chapters, creating it on first use.
+
+    Chapter content is split by token count rather than characters, so chunks
+    fill the model's context predictably whatever the text density. Sentence
+    ends are preferred over spaces, so the overlap only needs to be short.
+
+    tiktoken downloads its encoding the first time it is loaded, so the splitter
+    is only built once a long chapter needs it rather than when the module is
+    imported. Set TIKTOKEN_CACHE_DIR to a directory holding the encoding to run
+    without network access.
+
+    Returns:
+        RecursiveCharacterTextSplitter: The shared token-based splitter.
+    """
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        model_name="gpt-4",
+        chunk_size=CHUNK_SIZE,
+        chunk_overlap=CHUNK_OVERLAP,
+        separators=["\n\n", "\n", ". ", " ", ""],
+        keep_separator="end"
+    )
+
+# Content-addressed cache for parsed chapters and chapter summaries
+cache = diskcache.Cache(os.getenv("DOCX_CACHE_DIR", "/tmp/docx_cache"))
+
+def file_digest(file_path: str) -> str:
+    """
+    Computes the SHA-256 digest of a file without loading it into memory.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def setup_llm_caching():
+    """
+    Enables LangChain's global LLM cache so identical prompts are answered
+    without calling the model again.
 
-def split_into_chapters(doc: Document) -> list:
+    Uses Redis when REDIS_URL is set, otherwise a local SQLite database.
     """
-    Splits the document into chapters based on specific paragraph styles.
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        import redis
+        from langchain_community.cache import RedisCache
+        set_llm_cache(RedisCache(redis.Redis.from_url(redis_url)))
+        logger.info("Enabled Redis LLM cache.")
+    else:
+        database_path = os.getenv("LLM_CACHE_PATH", "/tmp/langchain_llm_cache.db")
+        set_llm_cache(SQLiteCache(database_path=database_path))
+        logger.info("Enabled SQLite LLM cache at %s.", database_path)
+
+def extract_chapters(file_path: str) -> list:
+    """
+    Extracts chapters straight from the document XML of a Word file.
+
+    This skips python-docx's object model: paragraphs and their style IDs are
+    read with lxml in a single pass over word/document.xml, and style IDs are
+    mapped to names once from word/styles.xml.
 
     Args:
-        doc (Document): The parsed Word document.
+        file_path (str): Path to the Word document on disk.
 
     Returns:
         list: A list of dictionaries with chapter titles and content.
     """
     try:
-        logging.debug("Splitting document into chapters based on styles.")
-        chapters = []
-        current_chapter = None
+        logger.debug("Extracting chapters from the document XML.")
+        with zipfile.ZipFile(file_path) as archive:
+            document = etree.fromstring(archive.read('word/document.xml'), xml_parser)
+            try:
+                styles = etree.fromstring(archive.read('word/styles.xml'), xml_parser)
+            except KeyError:
+                styles = None
 
-        # Define the styles that represent chapter titles
-        chapter_styles = ['Title', 'Heading 1', 'Heading 2']  # Adjust based on your document
+        # Built-in style names are stored in lowercase in styles.xml
+        chapter_styles = {style.lower() for style in CHAPTER_STYLES}
+        chapter_style_ids = set()
+        if styles is not None:
+            for style in styles.iterfind(qn('w:style')):
+                name = style.find(qn('w:name'))
+                if name is not None and name.get(qn('w:val'), '').lower() in chapter_styles:
+                    chapter_style_ids.add(style.get(qn('w:styleId')))
 
-        for paragraph in doc.paragraphs:
-            paragraph_text = paragraph.text.strip()
-            paragraph_style = paragraph.style.name
+        text_tag = qn('w:t')
+        break_tag = qn('w:br')
+        break_type = qn('w:type')
+        style_path = f"{qn('w:pPr')}/{qn('w:pStyle')}"
 
-            if paragraph_style in chapter_styles and paragraph_text:
+        chapters = []
+        current_title = None
+        current_lines = []
+
+        body = document.find(qn('w:body'))
+        for paragraph in body.iterfind(qn('w:p')):
+            parts = []
+            for node in run_content(paragraph):
+                if node.tag == text_tag:
+                    parts.append(node.text or '')
+                elif node.tag in run_text:
+                    # Page and column breaks have no text equivalent
+                    if node.tag != break_tag or node.get(break_type, 'textWrapping') == 'textWrapping':
+                        parts.append(run_text[node.tag])
+            paragraph_text = ''.join(parts).strip()
+            if not paragraph_text:
+                continue
+
+            style = paragraph.find(style_path)
+            if style is not None and style.get(qn('w:val')) in chapter_style_ids:
                 # Start of a new chapter
-                if current_chapter:
-                    chapters.append(current_chapter)
-                current_chapter = {
-                    'title': paragraph_text,
-                    'content': ''
-                }
-                logging.info(f"Detected new chapter: {paragraph_text}")
-            elif current_chapter and paragraph_text:
+                if current_title is not None:
+                    chapters.append({'title': current_title, 'content': '\n'.join(current_lines)})
+                current_title = paragraph_text
+                current_lines = []
+            elif current_title is not None:
                 # Append the paragraph to the current chapter content
-                current_chapter['content'] += paragraph_text + '\n'
+                current_lines.append(paragraph_text)
 
         # Add the last chapter if it exists
-        if current_chapter:
-            chapters.append(current_chapter)
+        if current_title is not None:
+            chapters.append({'title': current_title, 'content': '\n'.join(current_lines)})
 
-        logging.info("Successfully split the document into chapters.")
+        logger.info("Successfully extracted %d chapters from the document XML.", len(chapters))
         return chapters
     except Exception as e:
-        logging.error(f"Error splitting document into chapters: {str(e)}")
+        logger.error("Error extracting chapters from document XML: %s", e)
         raise
 
-def summarize_chapters(chapters: list) -> dict:
+async def summarize_chapter(chapter: dict, semaphore: asyncio.Semaphore, chunk_summaries: dict = None) -> str:
     """
-    Summarizes each chapter using LangChain and the LLM.
+    Summarizes one chapter with a map-reduce over its chunks.
+
+    Each chunk is summarized separately (map) and, when the chapter was split
+    into several chunks, the partial summaries are combined with one more call
+    (reduce). Every LLM call holds the shared semaphore, so the LLM_CONCURRENCY
+    cap applies across all chapters of the document.
 
     Args:
-        chapters (list): List of chapters with titles and content.
+        chapter (dict): The chapter with its title and content.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent LLM calls.
+        chunk_summaries (dict, optional): Pending chunk summaries by content hash,
+            shared across chapters so identical chunks are only summarized once.
 
     Returns:
-        dict: Dictionary of chapters with their summaries.
+        str: The chapter summary.
+    """
+    async def run(chain, inputs: dict) -> str:
+        async with semaphore:
+            result = await chain.ainvoke(inputs)
+            return result.strip()
+
+    if chunk_summaries is None:
+        chunk_summaries = {}
+
+    def summarize_chunk(chunk: str) -> asyncio.Future:
+        key = hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).hexdigest()
+        if key not in chunk_summaries:
+            chunk_summaries[key] = asyncio.ensure_future(run(get_summarize_chain(), {"section_content": chunk}))
+        return chunk_summaries[key]
+
+    chunks = get_text_splitter().split_text(chapter['content'])
+    partials = await asyncio.gather(
+        *[summarize_chunk(chunk) for chunk in chunks],
+        return_exceptions=True
+    )
+    for result in partials:
+        if isinstance(result, Exception):
+            raise result
+
+    if len(partials) == 1:
+        return partials[0]
+    logger.debug("Combining %d partial summaries for chapter: %s", len(partials), chapter['title'])
+    return await run(get_reduce_chain(), {"parts": "\n\n".join(partials)})
+
+async def summarize_chapter_group(chapters: list, semaphore: asyncio.Semaphore) -> dict:
+    """
+    Summarizes several short chapters with a single LLM request.
+
+    Args:
+        chapters (list): The chapters to summarize, with distinct titles.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent LLM calls.
+
+    Returns:
+        dict: Summaries of the chapters the model answered for, by title.
+
+    Raises:
+        ValueError: If the response is not a JSON object.
+    """
+    sections = "\n\n".join(f"## {chapter['title']}\n{chapter['content']}" for chapter in chapters)
+    async with semaphore:
+        response = await get_group_chain().ainvoke({"sections": sections})
+
+    parsed = json.loads(response)
+    if not isinstance(parsed, dict):
+        raise ValueError("Expected a JSON object of chapter summaries.")
+
+    titles = {chapter['title'] for chapter in chapters}
+    return {
+        title: summary.strip()
+        for title, summary in parsed.items()
+        if title in titles and isinstance(summary, str) and summary.strip()
+    }
+
+def group_short_chapters(pending: list) -> list:
+    """
+    Groups adjacent chapters whose combined content fits in GROUP_MAX_CHARS.
+
+    Args:
+        pending (list): (chapter index, chapter, cache key) triples in document order.
+
+    Returns:
+        list: Lists of (chapter index, chapter, cache key) triples; longer chapters are alone in their group.
+    """
+    groups = []
+    current = []
+    current_size = 0
+    for item in pending:
+        chapter = item[1]
+        size = len(chapter['content'])
+        titles = {grouped['title'] for _, grouped, _ in current}
+        if current and (current_size + size > GROUP_MAX_CHARS or chapter['title'] in titles):
+            groups.append(current)
+            current = []
+            current_size = 0
+        if size > GROUP_MAX_CHARS:
+            groups.append([item])
+            continue
+        current.append(item)
+        current_size += size
+    if current:
+        groups.append(current)
+    return groups
+
+async def aiter_chapter_summaries(chapters: list):
+    """
+    Summarizes the chapters concurrently and yields each summary as soon as
+    its chapter is done.
+
+    Adjacent short chapters are summarized together in one request to save
+    round-trips; chapters the model does not answer for are retried alone.
+
+    Args:
+        chapters (list): List of chapters with titles and content.
+
+    Yields:
+        tuple: The chapter's index in the document, its title, its summary (or an error
+        message) and whether summarizing it failed.
     """
-    summaries = {}
-    for chapter in chapters:
+    semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+    chunk_summaries = {}
+
+    ready = []
+    pending = []
+    for index, chapter in enumerate(chapters):
         chapter_title = chapter['title']
         content = chapter['content']
-        if content:
+
+        # Empty and very short chapters are not worth an LLM call
+        normalized_length = len(" ".join(content.split()))
+        if not normalized_length:
+            logger.debug("Chapter '%s' has no content to summarize.", chapter_title)
+            ready.append((index, chapter_title, "No content to summarize.", False))
+            continue
+        if normalized_length < SHORT_CHAPTER_LENGTH:
+            logger.debug("Chapter '%s' is short enough to keep as it is.", chapter_title)
+            ready.append((index, chapter_title, content.strip(), False))
+            continue
+
+        # Reuse summaries of chapters that were already summarized
+        key = ("summary", LLM_MODEL, chapter_title, hashlib.sha256(content.encode("utf-8")).hexdigest())
+        summary = cache.get(key)
+        if summary is not None:
+            ready.append((index, chapter_title, summary, False))
+            continue
+
+        pending.append((index, chapter, key))
+
+    async def summarize(group: list) -> list:
+        summaries = {}
+        if len(group) > 1:
             try:
-                logging.debug(f"Summarizing chapter: {chapter_title}")
-                summary = summarize_chain.run(section_content=content)
-                summaries[chapter_title] = summary.strip()
-                logging.info(f"Successfully summarized chapter: {chapter_title}")
+                logger.debug("Summarizing %d short chapters in one request.", len(group))
+                summaries = await summarize_chapter_group([chapter for _, chapter, _ in group], semaphore)
             except Exception as e:
-                logging.error(f"Error summarizing chapter '{chapter_title}': {str(e)}")
-                summaries[chapter_title] = f"Error summarizing chapter: {str(e)}"
-        else:
-            logging.warning(f"Chapter '{chapter_title}' has no content to summarize.")
-            summaries[chapter_title] = "No content to summarize."
-    return summaries
+                logger.warning("Could not summarize chapters together, retrying them one by one: %s", e)
+
+        missing = [chapter for _, chapter, _ in group if chapter['title'] not in summaries]
+        outcomes = await asyncio.gather(
+            *[summarize_chapter(chapter, semaphore, chunk_summaries) for chapter in missing],
+            return_exceptions=True
+        )
+        errors = {}
+        for chapter, outcome in zip(missing, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Error summarizing chapter '%s': %s", chapter['title'], outcome)
+                errors[chapter['title']] = outcome
+            else:
+                summaries[chapter['title']] = outcome
+
+        results = []
+        for index, chapter, key in group:
+            chapter_title = chapter['title']
+            if chapter_title in summaries:
+                cache.set(key, summaries[chapter_title])
+                logger.debug("Successfully summarized chapter: %s", chapter_title)
+                results.append((index, chapter_title, summaries[chapter_title], False))
+            else:
+                results.append((index, chapter_title, f"Error summarizing chapter: {str(errors[chapter_title])}", True))
+        return results
+
+    tasks = [asyncio.create_task(summarize(group)) for group in group_short_chapters(pending)]
+    try:
+        for item in ready:
+            yield item
+        for next_done in asyncio.as_completed(tasks):
+            for item in await next_done:
+                yield item
+    finally:
+        # Stop outstanding LLM calls if the consumer goes away early
+        for task in tasks:
+            task.cancel()
+
+async def asummarize_chapters(chapters: list) -> dict:
+    """
+    Summarizes the chapters concurrently using LangChain and the LLM.
+
+    Args:
+        chapters (list): List of chapters with titles and content.
+
+    Returns:
+        dict: Dictionary of chapters with their summaries, in document order.
+    """
+    results = {}
+    async for index, _, summary, _ in aiter_chapter_summaries(chapters):
+        results[index] = summary
+    return {chapter['title']: results[index] for index, chapter in enumerate(chapters)}
+
+async def load_chapters(file_path: str, file_name: str) -> list:
+    """
+    Validates the uploaded Word document and splits it into chapters.
 
-def process_document(file_content: bytes, file_name: str) -> dict:
+    Args:
+        file_path (str): Path to the uploaded Word document on disk.
+        file_name (str): The name of the uploaded file.
+
+    Returns:
+        list: A list of dictionaries with chapter titles and content.
+    """
+    # Check if the file has a .docx extension
+    if not file_name.lower().endswith(".docx"):
+        logger.error("Uploaded file '%s' is not a .docx file.", file_name)
+        raise ValueError("Only .docx files are supported.")
+
+    logger.info("Starting document processing for file: %s", file_name)
+    # Skip parsing entirely if this exact file was seen before.
+    # Hashing and parsing block, so they run in a worker thread to keep the event loop free
+    chapters_key = ("chapters", await asyncio.to_thread(file_digest, file_path))
+    chapters = cache.get(chapters_key)
+    if chapters is None:
+        chapters = await asyncio.to_thread(extract_chapters, file_path)  # Parse and split into chapters
+        cache.set(chapters_key, chapters)
+    else:
+        logger.info("Using cached chapters for file: %s", file_name)
+    return chapters
+
+async def process_document(file_path: str, file_name: str) -> dict:
     """
     Processes the uploaded Word document and returns chapter-wise summaries.
 
     Args:
-        file_content (bytes): The binary content of the Word document.
+        file_path (str): Path to the uploaded Word document on disk.
         file_name (str): The name of the uploaded file.
 
     Returns:
         dict: Chapter-wise summaries.
     """
     try:
-        # Check if the file has a .docx extension
-        if not file_name.lower().endswith(".docx"):
-            logging.error(f"Uploaded file '{file_name}' is not a .docx file.")
-            raise ValueError("Only .docx files are supported.")
-
-        logging.info(f"Starting document processing for file: {file_name}")
-        doc = read_word_document(file_content)  # Get the Document object
-        chapters = split_into_chapters(doc)      # Split into chapters
-        summaries = summarize_chapters(chapters)
-        logging.info(f"Successfully processed the document '{file_name}' and generated summaries.")
+        chapters = await load_chapters(file_path, file_name)
+        summaries = await asummarize_chapters(chapters)
+        logger.info("Successfully processed the document '%s' and generated summaries.", file_name)
         return summaries
 
     except Exception as e:
-        logging.error(f"Error processing document '{file_name}': {str(e)}")
+        logger.error("Error processing document '%s': %s", file_name, e)
+        raise
+
+async def stream_document(file_path: str, file_name: str):
+    """
+    Processes the uploaded Word document and yields chapter summaries as they
+    are generated.
+
+    Args:
+        file_path (str): Path to the uploaded Word document on disk.
+        file_name (str): The name of the uploaded file.
+
+    Yields:
+        tuple: The chapter's index in the document, its title, its summary (or an error
+        message) and whether summarizing it failed.
+    """
+    try:
+        chapters = await load_chapters(file_path, file_name)
+        async for index, chapter_title, summary, failed in aiter_chapter_summaries(chapters):
+            yield index, chapter_title, summary, failed
+        logger.info("Successfully processed the document '%s' and generated summaries.", file_name)
+
+    except Exception as e:
+        logger.error("Error processing document '%s': %s", file_name, e)
         raise
@@ -0,0 +1,11 @@
+# backend/tests/conftest.py
+
+import os
+import sys
+import tempfile
+
+# The backend modules are imported as top-level modules, as app.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep the module-level cache out of the shared default directory
+os.environ.setdefault("DOCX_CACHE_DIR", tempfile.mkdtemp(prefix="docx_cache_"))
@@ -0,0 +1,187 @@
+# backend/tests/test_chapter_summaries.py
+
+import asyncio
+import json
+
+import diskcache
+import pytest
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+import summarizer
+
+class StubChain:
+    """
+    Stands in for an LLM chain: answers with a function of its input and
+    records every call.
+    """
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = []
+
+    async def ainvoke(self, inputs: dict) -> str:
+        value = next(iter(inputs.values()))
+        self.calls.append(value)
+        await asyncio.sleep(0)
+        return self.answer(value)
+
+def parse_sections(sections: str) -> dict:
+    """
+    Reads back the chapters packed into a group prompt.
+    """
+    chapters = {}
+    for section in sections.split("\n\n"):
+        title, _, content = section.partition("\n")
+        chapters[title[len("## "):]] = content
+    return chapters
+
+def group_answer(sections: str) -> str:
+    return json.dumps({title: f"group summary of {content}" for title, content in parse_sections(sections).items()})
+
+def chunk_answer(chunk: str) -> str:
+    if "unreachable" in chunk:
+        raise ConnectionError("Ollama is unreachable")
+    return f" summary of {chunk} "
+
+@pytest.fixture
+def chains(monkeypatch, tmp_path):
+    stubs = {
+        "summarize": StubChain(chunk_answer),
+        "reduce": StubChain(lambda parts: "combined"),
+        "group": StubChain(group_answer),
+    }
+    monkeypatch.setattr(summarizer, "get_summarize_chain", lambda: stubs["summarize"])
+    monkeypatch.setattr(summarizer, "get_reduce_chain", lambda: stubs["reduce"])
+    monkeypatch.setattr(summarizer, "get_group_chain", lambda: stubs["group"])
+    # Split by characters so no tiktoken encoding is needed
+    splitter = RecursiveCharacterTextSplitter(chunk_size=200, chunk_overlap=0)
+    monkeypatch.setattr(summarizer, "get_text_splitter", lambda: splitter)
+    monkeypatch.setattr(summarizer, "cache", diskcache.Cache(str(tmp_path)))
+    monkeypatch.setattr(summarizer, "SHORT_CHAPTER_LENGTH", 10)
+    monkeypatch.setattr(summarizer, "GROUP_MAX_CHARS", 100)
+    return stubs
+
+def collect(chapters: list) -> list:
+    async def run():
+        return [item async for item in summarizer.aiter_chapter_summaries(chapters)]
+    return sorted(asyncio.run(run()))
+
+def test_group_short_chapters(monkeypatch):
+    monkeypatch.setattr(summarizer, "GROUP_MAX_CHARS", 100)
+    pending = [
+        (0, {'title': 'a', 'content': 'x' * 40}, 'key-a'),
+        (1, {'title': 'b', 'content': 'x' * 40}, 'key-b'),
+        (2, {'title': 'c', 'content': 'x' * 40}, 'key-c'),
+        (3, {'title': 'long', 'content': 'x' * 150}, 'key-long'),
+        (4, {'title': 'd', 'content': 'x' * 20}, 'key-d'),
+        (5, {'title': 'd', 'content': 'y' * 20}, 'key-d2'),
+    ]
+    groups = summarizer.group_short_chapters(pending)
+
+    # Groups stay within GROUP_MAX_CHARS, long chapters are alone and titles never repeat in a group
+    assert [[index for index, _, _ in group] for group in groups] == [[0, 1], [2], [3], [4], [5]]
+
+def test_short_chapters_are_summarized_together(chains):
+    chapters = [
+        {'title': 'Empty', 'content': ' '},
+        {'title': 'Tiny', 'content': 'too short'},
+        {'title': 'One', 'content': 'first chapter text'},
+        {'title': 'Two', 'content': 'second chapter text'},
+    ]
+
+    assert collect(chapters) == [
+        (0, 'Empty', "No content to summarize.", False),
+        (1, 'Tiny', 'too short', False),
+        (2, 'One', 'group summary of first chapter text', False),
+        (3, 'Two', 'group summary of second chapter text', False),
+    ]
+    assert len(chains["group"].calls) == 1
+    assert chains["summarize"].calls == []
+
+    # A second run is answered from the cache
+    collect(chapters)
+    assert len(chains["group"].calls) == 1
+
+def test_unparsable_group_falls_back_to_single_chapters(chains):
+    chains["group"].answer = lambda sections: "not JSON"
+    chapters = [
+        {'title': 'One', 'content': 'first chapter text'},
+        {'title': 'Two', 'content': 'second chapter text'},
+    ]
+
+    assert collect(chapters) == [
+        (0, 'One', 'summary of first chapter text', False),
+        (1, 'Two', 'summary of second chapter text', False),
+    ]
+    assert len(chains["group"].calls) == 1
+    assert sorted(chains["summarize"].calls) == ['first chapter text', 'second chapter text']
+
+def test_only_successful_summaries_are_cached(chains):
+    chains["group"].answer = lambda sections: "{}"
+    chapters = [
+        {'title': 'Down', 'content': 'server unreachable'},
+        {'title': 'Up', 'content': 'server answers'},
+    ]
+
+    assert collect(chapters) == [
+        (0, 'Down', 'Error summarizing chapter: Ollama is unreachable', True),
+        (1, 'Up', 'summary of server answers', False),
+    ]
+
+    # The failed chapter is summarized again, the other one comes from the cache
+    chains["summarize"].calls.clear()
+    collect(chapters)
+    assert chains["summarize"].calls == ['server unreachable']
+
+def test_duplicate_titles_are_summarized_separately(chains):
+    chapters = [
+        {'title': 'Notes', 'content': 'first notes'},
+        {'title': 'Notes', 'content': 'second notes'},
+    ]
+
+    assert collect(chapters) == [
+        (0, 'Notes', 'summary of first notes', False),
+        (1, 'Notes', 'summary of second notes', False),
+    ]
+    # Each chapter is in its own group, so neither goes through the group chain
+    assert chains["group"].calls == []
+
+def test_long_chapters_are_reduced(chains):
+    content = "\n\n".join(["word " * 30] * 3)
+    chapters = [{'title': 'Long', 'content': content}]
+
+    assert collect(chapters) == [(0, 'Long', 'combined', False)]
+    # Identical chunks are only summarized once
+    assert len(chains["summarize"].calls) == 1
+    assert len(chains["reduce"].calls) == 1
+
+def test_closing_early_cancels_pending_calls(chains):
+    started = []
+    cancelled = []
+
+    class HangingChain:
+        async def ainvoke(self, inputs: dict) -> str:
+            started.append(inputs)
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(inputs)
+                raise
+
+    chains["group"].ainvoke = HangingChain().ainvoke
+    chapters = [
+        {'title': 'Tiny', 'content': 'too short'},
+        {'title': 'One', 'content': 'first chapter text'},
+        {'title': 'Two', 'content': 'second chapter text'},
+    ]
+
+    async def run():
+        summaries = summarizer.aiter_chapter_summaries(chapters)
+        first = await summaries.__anext__()
+        await asyncio.sleep(0.01)
+        await summaries.aclose()
+        await asyncio.sleep(0)
+        return first
+
+    assert asyncio.run(run()) == (0, 'Tiny', 'too short', False)
+    assert started and cancelled == started
@@ -0,0 +1,107 @@
+# backend/tests/test_extract_chapters.py
+
+import zipfile
+
+from docx import Document
+from docx.oxml import parse_xml
+
+from summarizer import CHAPTER_STYLES, extract_chapters
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"'
+)
+
+# A run holding a text box, with the same text in both branches of mc:AlternateContent
+TEXT_BOX_RUN = f"""
+<w:r {NAMESPACES}>
+  <w:t xml:space="preserve">Anchor </w:t>
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps"><w:drawing><wps:txbx><w:txbxContent>
+      <w:p><w:r><w:t>Text box</w:t></w:r></w:p>
+    </w:txbxContent></wps:txbx></w:drawing></mc:Choice>
+    <mc:Fallback><w:pict><v:textbox><w:txbxContent>
+      <w:p><w:r><w:t>Text box</w:t></w:r></w:p>
+    </w:txbxContent></v:textbox></w:pict></mc:Fallback>
+  </mc:AlternateContent>
+</w:r>
+"""
+
+def split_with_python_docx(file_path: str) -> list:
+    """
+    Splits a document into chapters with python-docx's paragraph and style model,
+    as the backend did before extract_chapters.
+    """
+    chapters = []
+    current_title = None
+    current_lines = []
+    for paragraph in Document(file_path).paragraphs:
+        paragraph_text = paragraph.text.strip()
+        if not paragraph_text:
+            continue
+        if paragraph.style.name in CHAPTER_STYLES:
+            if current_title is not None:
+                chapters.append({'title': current_title, 'content': '\n'.join(current_lines)})
+            current_title = paragraph_text
+            current_lines = []
+        elif current_title is not None:
+            current_lines.append(paragraph_text)
+    if current_title is not None:
+        chapters.append({'title': current_title, 'content': '\n'.join(current_lines)})
+    return chapters
+
+def build_document(file_path: str):
+    doc = Document()
+    doc.add_paragraph("Text before the first chapter is ignored.")
+    doc.add_heading("The Book", level=0)
+    doc.add_paragraph("Foreword.")
+
+    heading = doc.add_heading("Chapter One", level=1)
+    heading._p.append(parse_xml(TEXT_BOX_RUN))
+    paragraph = doc.add_paragraph("Before a text box: ")
+    paragraph._p.append(parse_xml(TEXT_BOX_RUN))
+    paragraph = doc.add_paragraph("Link: ")
+    paragraph._p.append(parse_xml(f'<w:hyperlink {NAMESPACES}><w:r><w:t>example</w:t></w:r></w:hyperlink>'))
+    paragraph._p.append(parse_xml(f'<w:fldSimple {NAMESPACES} w:instr="PAGE"><w:r><w:t>7</w:t></w:r></w:fldSimple>'))
+    paragraph._p.append(parse_xml(f'<w:ins {NAMESPACES} w:id="1" w:author="a"><w:r><w:t>inserted</w:t></w:r></w:ins>'))
+    paragraph._p.append(parse_xml(
+        f'<w:r {NAMESPACES}><w:t>page</w:t><w:br w:type="page"/><w:t>line</w:t><w:br/>'
+        f'<w:t>tab</w:t><w:tab/><w:t>no</w:t><w:noBreakHyphen/><w:t>break</w:t></w:r>'
+    ))
+    doc.add_paragraph("")
+
+    doc.add_heading("Section", level=2)
+    doc.add_paragraph("Section text.")
+    doc.add_heading("Subsection", level=3)
+    doc.add_paragraph("Heading 3 is not a chapter title.")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Table cells are not paragraphs of the body."
+
+    doc.add_heading("Empty Chapter", level=1)
+    doc.save(file_path)
+
+def test_matches_python_docx(tmp_path):
+    file_path = str(tmp_path / "document.docx")
+    build_document(file_path)
+
+    chapters = extract_chapters(file_path)
+
+    assert chapters == split_with_python_docx(file_path)
+    assert [chapter['title'] for chapter in chapters] == [
+        "The Book", "Chapter OneAnchor", "Section", "Empty Chapter"
+    ]
+    assert "Text box" not in str(chapters)
+
+def test_without_styles_part(tmp_path):
+    file_path = str(tmp_path / "document.docx")
+    build_document(file_path)
+    stripped_path = str(tmp_path / "stripped.docx")
+    with zipfile.ZipFile(file_path) as source, zipfile.ZipFile(stripped_path, "w") as target:
+        for item in source.infolist():
+            if item.filename != "word/styles.xml":
+                target.writestr(item, source.read(item.filename))
+
+    # Without styles no paragraph is a chapter title
+    assert extract_chapters(stripped_path) == []
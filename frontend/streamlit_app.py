@@ -1,12 +1,18 @@
 import logging
+import os
 import streamlit as st
-import requests
+import httpx
+import orjson
+import diskcache
 import uuid
+import hashlib
+import tempfile
+import time
 from PIL import Image
 import base64
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+# Configure logging; set LOG_LEVEL=DEBUG for upload details
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper(), format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 # Set the page configuration (must be first command)
@@ -17,32 +23,68 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Function to add background image or enhance UI
-def add_bg_from_url():
+# Background image bundled with the app, embedded inline so the browser fetches nothing extra
+BACKGROUND_PATH = os.path.join(os.path.dirname(__file__), "assets", "background.webp")
+
+@st.cache_resource
+def background_css():
     """
-    Adds a background image to the Streamlit app.
+    Builds the background style once per process instead of on every rerun.
+
+    Returns:
+        str: The <style> block setting the background image.
     """
-    st.markdown(
-         f"""
+    with open(BACKGROUND_PATH, "rb") as f:
+        encoded = base64.b64encode(f.read()).decode()
+    return f"""
          <style>
          .stApp {{
-             background-image: url("https://images.unsplash.com/photo-1581090464230-3a94a406c829?ixlib=rb-4.0.3&auto=format&fit=crop&w=1950&q=80");
+             background-image: url("data:image/webp;base64,{encoded}");
              background-attachment: fixed;
              background-size: cover;
          }}
          </style>
-         """,
-         unsafe_allow_html=True
-     )
+         """
+
+# Function to add background image or enhance UI
+def add_background():
+    """
+    Adds a background image to the Streamlit app.
+    """
+    st.markdown(background_css(), unsafe_allow_html=True)
 
 # Call the function to set background
-add_bg_from_url()
+add_background()
+
+LOGO_URL = "https://streamlit.io/images/brand/streamlit-logo-secondary-colormark-darktext.png"
+
+# Seconds before the logo is downloaded again, including after a failed download
+LOGO_CACHE_TTL = 600
+
+@st.cache_data(ttl=LOGO_CACHE_TTL, show_spinner=False)
+def get_logo():
+    """
+    Downloads the logo at most once per LOGO_CACHE_TTL instead of on every run.
+
+    Failures are cached too, so while the logo host is unreachable reruns do
+    not wait for the download to time out.
+
+    Returns:
+        bytes: The logo image, or None if it could not be downloaded.
+    """
+    try:
+        response = httpx.get(LOGO_URL, timeout=2, follow_redirects=True)
+        response.raise_for_status()
+        return response.content
+    except httpx.HTTPError as e:
+        logger.warning("Could not download the logo: %s", e)
+        return None
 
 # Header with logo and title
 col1, col2 = st.columns([1, 3])
 with col1:
-    # Add a logo image
-    st.image("https://streamlit.io/images/brand/streamlit-logo-secondary-colormark-darktext.png", width=100)
+    # Add a logo image; without a downloaded copy, leave the download to the browser
+    st.image(get_logo() or LOGO_URL, width=100)
 with col2:
     st.title("📄 Document Chapter Summarizer")
 
@@ -51,79 +93,236 @@ st.markdown("""
 ### Upload a Word document, and the application will summarize each chapter for you.
 """)
 
+# Backend endpoint that streams the summary of each chapter as it is generated
+API_URL = "http://localhost:8001/summarize/stream"
+
+# Attempts per request, and the backend statuses worth retrying
+HTTP_MAX_ATTEMPTS = 3
+RETRY_STATUS_CODES = {502, 503, 504}
+
+# Every .docx is a ZIP archive, which starts with this signature
+DOCX_MAGIC = b"PK\x03\x04"
+
+# Size in bytes past which the least recently used summaries are evicted from the store
+SUMMARY_STORE_SIZE_LIMIT = 64 * 2**20
+
+# Number of chapter summaries shown before the user picks others
+DEFAULT_VISIBLE_CHAPTERS = 5
+
 # Initialize session state for session_id and summaries
 if 'session_id' not in st.session_state:
     st.session_state['session_id'] = None
 if 'summaries' not in st.session_state:
     st.session_state['summaries'] = {}
+# The ID sent to the backend is minted once per UI session, so retries reuse it
+st.session_state.setdefault('client_session_id', str(uuid.uuid4()))
+# Set while a document is being summarized, so repeated clicks do not send it again
+st.session_state.setdefault('in_flight', False)
 
-def upload_and_summarize(uploaded_file):
+@st.cache_resource
+def get_summary_store():
     """
-    Uploads the file to the backend API and retrieves summaries.
+    Returns the on-disk store of summaries, keyed by session ID and by document content.
+
+    Returns:
+        diskcache.Cache: The store shared by all browser sessions.
+    """
+    return diskcache.Cache(
+        os.getenv("SUMMARY_STORE_DIR", os.path.join(tempfile.gettempdir(), "summary_store")),
+        size_limit=SUMMARY_STORE_SIZE_LIMIT,
+        eviction_policy="least-recently-used"
+    )
+
+# Restore the summaries of a session from its URL after a page reload
+restored_session_id = st.query_params.get("session_id")
+if restored_session_id and not st.session_state['summaries']:
+    restored_summaries = get_summary_store().get(restored_session_id)
+    if restored_summaries:
+        st.session_state['session_id'] = restored_session_id
+        st.session_state['summaries'] = restored_summaries
+
+@st.cache_resource
+def get_http_client():
+    """
+    Returns an HTTP client shared across reruns so connections to the backend are kept alive.
+
+    Summarization can take minutes on long documents, so reads never time out.
+    Failed connections are retried by the transport.
+
+    Returns:
+        httpx.Client: The pooled client.
+    """
+    return httpx.Client(
+        transport=httpx.HTTPTransport(retries=HTTP_MAX_ATTEMPTS),
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        timeout=httpx.Timeout(10.0, read=None)
+    )
+
+def notify(kind, message):
+    """
+    Queues a message to show on the next run of the script.
+
+    Summarizing ends with a rerun to re-enable the Summarize button, which
+    would clear messages shown directly.
+
+    Args:
+        kind (str): The Streamlit status element to use, e.g. "success" or "error".
+        message (str): The message to show.
+    """
+    st.session_state.setdefault('notices', []).append((kind, message))
+
+def stream_summaries(file_bytes, file_name, file_type, session_id):
+    """
+    Sends a document to the backend API and yields chapter summaries as they are generated.
+
+    Args:
+        file_bytes (bytes): The content of the Word document.
+        file_name (str): The name of the document.
+        file_type (str): The MIME type of the document.
+        session_id (str): The session ID sent to the backend.
+
+    Yields:
+        tuple: The index in the document, title and summary of each chapter, in completion
+        order, and whether the summary is an error message.
+    """
+    client = get_http_client()
+    files = {'file': (file_name, file_bytes, file_type)}
+    params = {'session_id': session_id}
+
+    logger.info("Sending file to API for summarization...")
+    for attempt in range(HTTP_MAX_ATTEMPTS):
+        request = client.build_request("POST", API_URL, files=files, params=params)
+        response = client.send(request, stream=True)
+        if response.status_code not in RETRY_STATUS_CODES or attempt == HTTP_MAX_ATTEMPTS - 1:
+            break
+        response.close()
+        logger.warning("Backend returned %s, retrying", response.status_code)
+        time.sleep(0.2 * 2 ** attempt)
+
+    try:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            item = orjson.loads(line)
+            if "error" in item:
+                raise ValueError(item["error"])
+            yield item["index"], item["title"], item["summary"], item["failed"]
+    finally:
+        response.close()
+
+def upload_and_summarize(uploaded_file, progress):
+    """
+    Uploads the file to the backend API and shows each chapter summary as soon as it arrives.
+
+    Summaries are cached by file content, so summarizing the same document
+    again does not call the backend. Documents with a failed chapter are not
+    cached, so they are summarized again on the next try.
 
     Args:
         uploaded_file (UploadedFile): The uploaded Word document.
+        progress (DeltaGenerator): Container the summaries are shown in while the rest are generated.
 
     Returns:
-        dict: Summaries of each chapter.
+        tuple: Summaries of each chapter, in document order, and the session ID.
     """
-    api_url = "http://localhost:8001/summarize"
-    
     # Log the MIME type for debugging purposes
-    logger.debug(f"Uploaded file MIME type: {uploaded_file.type}")
+    logger.debug("Uploaded file MIME type: %s", uploaded_file.type)
     
-    # Ensure the file has the correct MIME type
-    if uploaded_file.type != "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        logger.error(f"Uploaded file is not a valid .docx file. MIME type: {uploaded_file.type}")
-        st.error("Only .docx files are supported.")
+    # Read the content once and reuse it for validation, the cache key and the upload
+    file_bytes = uploaded_file.getvalue()
+
+    # Check the file signature rather than the MIME type, which some browsers report as application/octet-stream
+    if not file_bytes.startswith(DOCX_MAGIC):
+        logger.error("Uploaded file is not a valid .docx file. MIME type: %s", uploaded_file.type)
+        notify("error", "Only .docx files are supported.")
         return {}, None
-    
-    # Continue with summarization
-    files = {'file': (uploaded_file.name, uploaded_file.read(), uploaded_file.type)}
-    params = {'session_id': str(uuid.uuid4())}
-    
+
+    document_key = ("document", hashlib.blake2b(file_bytes, digest_size=32).hexdigest())
+    session_id = st.session_state['client_session_id']
+    summaries = get_summary_store().get(document_key)
+    if summaries:
+        logger.info("Summaries found in cache for %s", uploaded_file.name)
+        return summaries, session_id
+
+    results = {}
+    failed = False
     try:
-        logger.info("Sending file to API for summarization...")
-        response = requests.post(api_url, files=files, params=params)
-        response.raise_for_status()
-        data = response.json()
-        logger.info(f"Summarization successful for session_id: {data.get('session_id')}")
-        return data.get("summaries", {}), data.get("session_id")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error while uploading file: {str(e)}")
-        st.error("Failed to upload or summarize the file. Please try again.")
+        for index, chapter, summary, chapter_failed in stream_summaries(
+            file_bytes, uploaded_file.name, uploaded_file.type, session_id
+        ):
+            results[index] = (chapter, summary)
+            failed = failed or chapter_failed
+            with progress.expander(f"📖 {chapter}"):
+                st.write(summary)
+    except (httpx.HTTPError, ValueError) as e:
+        logger.error("Error while uploading file: %s", e)
+        notify("error", "Failed to upload or summarize the file. Please try again.")
         return {}, None
 
+    # Chapters arrive as they finish; keep them in document order
+    summaries = dict(results[index] for index in sorted(results))
+    if not failed:
+        get_summary_store()[document_key] = summaries
+    logger.info("Summarization successful for session_id: %s", session_id)
+    return summaries, session_id
+
 # File uploader widget with better UI
 with st.container():
     uploaded_file = st.file_uploader("📂 **Upload a Word Document**", type=["docx"], accept_multiple_files=False)
 
     if uploaded_file is not None:
         st.success(f"**Filename:** {uploaded_file.name}")
-        logger.debug(f"File uploaded: {uploaded_file.name}")
+        logger.debug("File uploaded: %s", uploaded_file.name)
         
+        def start_summarizing():
+            """
+            Marks a summarization as in flight before the rerun, so the button renders disabled.
+            """
+            st.session_state['in_flight'] = True
+
         # Button to initiate summarization with enhanced styling
-        summarize_button = st.button("🔍 **Summarize**", key='summarize_button')
+        summarize_button = st.button(
+            "🔍 **Summarize**", key='summarize_button',
+            disabled=st.session_state['in_flight'], on_click=start_summarizing
+        )
         
         if summarize_button:
-            with st.spinner('🔍 Summarizing chapters...'):
-                summaries, session_id = upload_and_summarize(uploaded_file)
-                if summaries and session_id:
-                    st.session_state['summaries'] = summaries
-                    st.session_state['session_id'] = session_id
-                    st.success("✅ Summarization complete!")
-                    logger.info(f"Summaries stored in session state for session_id: {session_id}")
-                else:
-                    st.error("❌ Failed to retrieve summaries.")
-                    logger.error("Summarization process failed.")
-        
-        # Display summaries if available
-        if st.session_state['summaries']:
-            st.markdown("### 📑 **Chapter Summaries**")
-            for chapter, summary in st.session_state['summaries'].items():
-                with st.expander(f"📖 {chapter}"):
-                    st.write(summary)
-                    logger.debug(f"Displaying summary for chapter: {chapter}")
+            try:
+                # Summaries appear here as they arrive, then move to the list below
+                live_summaries = st.empty()
+                with st.spinner('🔍 Summarizing chapters...'):
+                    summaries, session_id = upload_and_summarize(uploaded_file, live_summaries.container())
+                    live_summaries.empty()
+                    if summaries and session_id:
+                        st.session_state['summaries'] = summaries
+                        st.session_state['session_id'] = session_id
+                        get_summary_store()[session_id] = summaries
+                        st.query_params["session_id"] = session_id
+                        notify("success", "✅ Summarization complete!")
+                        logger.info("Summaries stored in session state for session_id: %s", session_id)
+                    else:
+                        notify("error", "❌ Failed to retrieve summaries.")
+                        logger.error("Summarization process failed.")
+            finally:
+                st.session_state['in_flight'] = False
+            # The button was drawn disabled in this run; rerun to draw it enabled again
+            st.rerun()
+
+        # Show the outcome of the last summarization
+        for kind, message in st.session_state.pop('notices', []):
+            getattr(st, kind)(message)
+
+    # Display summaries if available, including ones restored after a reload
+    if st.session_state['summaries']:
+        st.markdown("### 📑 **Chapter Summaries**")
+        summaries = st.session_state['summaries']
+        # Only the picked chapters are rendered, so long documents keep reruns fast
+        chapters = list(summaries)
+        picked = st.multiselect("Chapters", chapters, default=chapters[:DEFAULT_VISIBLE_CHAPTERS])
+        for chapter in picked:
+            with st.expander(f"📖 {chapter}"):
+                st.write(summaries[chapter])
 
 # Sidebar for session management
 with st.sidebar:
@@ -132,14 +331,16 @@ with st.sidebar:
     def start_new_session():
         """
         Resets the session state to start a new chat.
+
+        Runs as the button's callback, before the script reruns, so no extra rerun is needed.
         """
         logger.info("Starting a new session")
         st.session_state['session_id'] = None
         st.session_state['summaries'] = {}
-        st.experimental_rerun()
+        st.session_state['client_session_id'] = str(uuid.uuid4())
+        st.query_params.clear()
     
-    if st.button("🚀 **Start New Chat**"):
-        start_new_session()
+    st.button("🚀 **Start New Chat**", on_click=start_new_session)
     
     st.markdown("""
     ---